@@ -9,16 +9,16 @@ values as understood by a specific scale and return string
 representations of those values. Manipulating the string
 representation of a value helps improve readability of the guide.
 """
-import re
-from bisect import bisect_right
 from warnings import warn
 
 import numpy as np
+import pandas as pd
+from matplotlib import rcParams
 from matplotlib.dates import DateFormatter, date2num
 from matplotlib.ticker import ScalarFormatter
 
 from .breaks import timedelta_helper
-from .utils import round_any, precision, match
+from .utils import round_any, precision
 from .utils import same_log10_order_of_magnitude
 
 
@@ -38,6 +38,9 @@ __all__ = [
     'number_bytes_format'
 ]
 
+# Ordinal suffixes for numbers ending in 0, 1, 2, 3 & 4-9
+_ORDINAL_SUFFIXES = ('th', 'st', 'nd', 'rd', 'th')
+
 
 class custom_format:
     """
@@ -64,6 +67,14 @@ class custom_format:
         self.fmt = fmt
         self.style = style
 
+        if style == 'new':
+            self._apply = fmt.format
+        elif style == 'old':
+            self._apply = fmt.__mod__
+        else:
+            raise ValueError(
+                "style should be either 'new' or 'old'")
+
     def __call__(self, x):
         """
         Format a sequence of inputs
@@ -78,13 +89,8 @@ class custom_format:
         out : list
             List of strings.
         """
-        if self.style == 'new':
-            return [self.fmt.format(val) for val in x]
-        elif self.style == 'old':
-            return [self.fmt % val for val in x]
-        else:
-            raise ValueError(
-                "style should be either 'new' or 'old'")
+        apply = self._apply
+        return [apply(val) for val in x]
 
 
 # formatting functions
@@ -117,6 +123,20 @@ class currency_format:
         self.suffix = suffix
         self.digits = digits
         self.big_mark = big_mark
+        self._tpl_key = None
+
+    def _template(self):
+        """
+        Return format method, rebuilt only if the parameters change
+        """
+        key = (self.prefix, self.suffix, self.digits, self.big_mark)
+        if key != self._tpl_key:
+            # create {:.2f} or {:,.2f}
+            comma = ',' if self.big_mark else ''
+            self._tpl = ''.join((self.prefix, '{:', comma, '.',
+                                 str(self.digits), 'f}', self.suffix))
+            self._tpl_key = key
+        return self._tpl.format
 
     def __call__(self, x):
         """
@@ -132,13 +152,9 @@ class currency_format:
         out : list
             List of strings.
         """
-        # create {:.2f} or {:,.2f}
         big_mark = self.big_mark
-        comma = ',' if big_mark else ''
-        tpl = ''.join((self.prefix, '{:', comma, '.',
-                       str(self.digits), 'f}', self.suffix))
-
-        labels = [tpl.format(val) for val in x]
+        fmt = self._template()
+        labels = [fmt(val) for val in x]
         if big_mark and big_mark != ',':
             labels = [val.replace(',', big_mark) for val in labels]
         return labels
@@ -205,6 +221,8 @@ class percent_format:
     """
     def __init__(self, use_comma=False):
         self.big_mark = ',' if use_comma else ''
+        # currency formatters for each (digits, big_mark)
+        self._formatters = {}
 
     def __call__(self, x):
         """
@@ -223,8 +241,13 @@ class percent_format:
         if len(x) == 0:
             return []
 
+        x = np.asarray(x, dtype=float)
         _precision = precision(x)
-        x = round_any(x, _precision / 100) * 100
+        # Round and scale in place to avoid intermediate arrays
+        accuracy = _precision / 100
+        x = np.round(x / accuracy)
+        x *= accuracy
+        x *= 100
 
         # When the precision is less than 1, we show
         if _precision > 1:
@@ -232,15 +255,21 @@ class percent_format:
         else:
             digits = abs(int(np.log10(_precision)))
 
-        formatter = currency_format(prefix='',
-                                    suffix='%',
-                                    digits=digits,
-                                    big_mark=self.big_mark)
+        key = (digits, self.big_mark)
+        try:
+            formatter = self._formatters[key]
+        except KeyError:
+            formatter = self._formatters[key] = currency_format(
+                prefix='', suffix='%', digits=digits,
+                big_mark=self.big_mark)
+
         labels = formatter(x)
         # Remove unnecessary zeros after the decimal
-        pattern = re.compile(r'\.0+%$')
-        if all(pattern.search(val) for val in labels):
-            labels = [pattern.sub('%', val) for val in labels]
+        if digits:
+            zeros = ''.join(['.', '0'*digits, '%'])
+            if all(val.endswith(zeros) for val in labels):
+                n = len(zeros)
+                labels = [val[:-n] + '%' for val in labels]
         return labels
 
 
@@ -277,18 +306,20 @@ class scientific_format:
         if len(x) == 0:
             return []
 
-        zeros_re = re.compile(r'(0+)e')
-
-        def count_zeros(s):
-            match = zeros_re.search(s)
-            if match:
-                return len(match.group(1))
+        # format and then remove superfluous zeros, i.e. the
+        # least number of zeros before the exponent of any label
+        labels = self.formatter(x)
+        n = len(labels[0])
+        for val in labels:
+            i = val.find('e')
+            if i < 0:
+                n = 0
             else:
-                return 0
+                n = min(n, i - len(val[:i].rstrip('0')))
+
+            if not n:
+                break
 
-        # format and then remove superfluous zeros
-        labels = self.formatter(x)
-        n = min([count_zeros(val) for val in labels])
         if n:
             labels = [val.replace('0'*n+'e', 'e') for val in labels]
         return labels
@@ -312,11 +343,11 @@ def _format(formatter, x):
     labels = [formatter(tick) for tick in x]
 
     # Remove unnecessary decimals
-    pattern = re.compile(r'\.0+$')
     for i, label in enumerate(labels):
-        match = pattern.search(label)
-        if match:
-            labels[i] = pattern.sub('', label)
+        if label.endswith('0'):
+            head, point, decimals = label.rpartition('.')
+            if point and not decimals.strip('0'):
+                labels[i] = head
 
     # MPL does not add the exponential component
     if oom:
@@ -417,11 +448,13 @@ class log_format:
 
         # If any are in exponential format, make all of
         # them expontential
-        has_e = np.array(['e' in x for x in labels])
-        if not np.all(has_e) and not np.all(~has_e):
-            labels = [as_exp(x) for x in labels]
+        count = sum(1 for x in labels if 'e' in x)
+        if count:
+            if count != len(labels):
+                labels = [as_exp(x) for x in labels]
 
-        labels = [remove_zeroes(x) for x in labels]
+            # Only labels in exponential format have zeros to remove
+            labels = [remove_zeroes(x) for x in labels]
         return labels
 
     def __call__(self, x):
@@ -443,24 +476,24 @@ class log_format:
 
         # Decide on using exponents
         if self.base == 10:
-            xmin = int(np.floor(np.log10(np.min(x))))
-            xmax = int(np.ceil(np.log10(np.max(x))))
+            logs = np.log10(np.asarray(x))
+            xmin = int(np.floor(logs.min()))
+            xmax = int(np.ceil(logs.max()))
             emin, emax = self.exponent_limits
-            all_multiples = np.all(
-                [np.log10(num).is_integer() for num in x])
+            all_multiples = np.all(np.floor(logs) == logs)
             # Order of magnitude of the minimum and maximum
             if same_log10_order_of_magnitude(x):
                 f = mpl_format()
                 f.formatter.set_powerlimits((emin, emax))
                 return f(x)
             elif all_multiples and (xmin <= emin or xmax >= emax):
-                fmt = '{:1.0e}'
+                fmt = '{:1.0e}'.format
             else:
-                fmt = '{:g}'
+                fmt = '{:g}'.format
         else:
-            fmt = '{:g}'
+            fmt = '{:g}'.format
 
-        labels = [fmt.format(num) for num in x]
+        labels = [fmt(num) for num in x]
         return self._tidyup_labels(labels)
 
 
@@ -513,6 +546,7 @@ class date_format:
     """
     def __init__(self, fmt='%Y-%m-%d', tz=None):
         self.formatter = DateFormatter(fmt, tz=tz)
+        self.fmt = fmt
         self.tz = tz
 
     def __call__(self, x):
@@ -529,8 +563,12 @@ class date_format:
         out : list
             List of strings.
         """
+        if len(x) == 0:
+            return []
+
         # Formatter timezone
-        if self.tz is None and len(x):
+        tz = self.tz
+        if tz is None:
             tz = self.formatter.tz = x[0].tzinfo
 
             if not all(value.tzinfo == tz for value in x):
@@ -540,6 +578,23 @@ class date_format:
                        "formatter and pass the time zone.")
                 warn(msg.format(tz.zone))
 
+        # Dates that pandas can hold in a single index are
+        # converted and formatted in one go
+        try:
+            index = pd.DatetimeIndex(x)
+        except (TypeError, ValueError):
+            index = None
+
+        if index is not None and not index.hasnans:
+            # Naive dates are in UTC, and like the matplotlib
+            # formatter, the default time zone is that of rcParams
+            if index.tz is None:
+                index = index.tz_localize('UTC')
+            if tz is None:
+                tz = rcParams['timezone']
+            index = index.tz_convert(tz)
+            return index.strftime(self.fmt).tolist()
+
         # The formatter is tied to axes and takes
         # breaks in ordinal format.
         x = [date2num(val) for val in x]
@@ -608,7 +663,6 @@ class timedelta_format:
         if len(x) == 0:
             return []
 
-        labels = []
         values, _units = timedelta_helper.format_info(x, self.units)
         plural = '' if _units.endswith('s') else 's'
         ulabel = self.abbreviations[_units]
@@ -619,12 +673,13 @@ class timedelta_format:
         if not self.add_units:
             return _labels
 
-        for num, num_label in zip(values, _labels):
-            s = '' if num == 1 else plural
-            # 0 has no units
-            _ulabel = '' if num == 0 else ulabel+s
-            labels.append(''.join([num_label, _ulabel]))
-
+        ulabel_plural = ulabel + plural
+        # 0 has no units
+        labels = [
+            num_label + ('' if num == 0 else
+                         ulabel if num == 1 else ulabel_plural)
+            for num, num_label in zip(values, _labels)
+        ]
         return labels
 
 
@@ -653,6 +708,24 @@ class pvalue_format:
     def __init__(self, accuracy=0.001, add_p=False):
         self.accuracy = accuracy
         self.add_p = add_p
+        self._labels_key = None
+
+    def _labels(self):
+        """
+        Return format method & label for values below the accuracy
+
+        They are rebuilt only if the parameters change.
+        """
+        key = (self.accuracy, self.add_p)
+        if key != self._labels_key:
+            if self.add_p:
+                self._eq_fmt = 'p={:g}'.format
+                self._below_label = 'p<{:g}'.format(self.accuracy)
+            else:
+                self._eq_fmt = '{:g}'.format
+                self._below_label = '<{:g}'.format(self.accuracy)
+            self._labels_key = key
+        return self._eq_fmt, self._below_label
 
     def __call__(self, x):
         """
@@ -670,36 +743,22 @@ class pvalue_format:
         """
         x = round_any(x, self.accuracy)
         below = [num < self.accuracy for num in x]
-
-        if self.add_p:
-            eq_fmt = 'p={:g}'.format
-            below_label = 'p<{:g}'.format(self.accuracy)
-        else:
-            eq_fmt = '{:g}'.format
-            below_label = '<{:g}'.format(self.accuracy)
-
+        eq_fmt, below_label = self._labels()
         labels = [below_label if b else eq_fmt(i)
                   for i, b in zip(x, below)]
         return labels
 
 
-def ordinal(n, prefix='', suffix='', big_mark=''):
+def _ordinal_suffixes(n):
+    """
+    Ordinal suffixes for an array of integers
+    """
     # General Case: 0th, 1st, 2nd, 3rd, 4th, 5th, 6th, 7th, 8th, 9th
     # Special Case: 10th, 11th, 12th, 13th
-    n = int(n)
-    idx = np.min((n % 10, 4))
-    _suffix = ['th', 'st', 'nd', 'rd', 'th'][idx]
-    if 11 <= (n % 100) <= 13:
-        _suffix = 'th'
-
-    if big_mark:
-        s = '{:,}'.format(n)
-        if big_mark != ',':
-            s = s.replace(',', big_mark)
-    else:
-        s = '{}'.format(n)
-
-    return '{}{}{}{}'.format(prefix, s, _suffix, suffix)
+    mod100 = n % 100
+    idx = np.where((mod100 >= 11) & (mod100 <= 13),
+                   0, np.minimum(n % 10, 4))
+    return [_ORDINAL_SUFFIXES[i] for i in idx.tolist()]
 
 
 class ordinal_format:
@@ -729,8 +788,30 @@ class ordinal_format:
         self.big_mark = big_mark
 
     def __call__(self, x):
-        labels = [ordinal(num, self.prefix, self.suffix, self.big_mark)
-                  for num in x]
+        if not hasattr(x, '__len__'):
+            x = list(x)
+
+        if len(x) == 0:
+            return []
+
+        x = np.asarray(x)
+        if x.dtype.kind in 'iu':
+            n = x
+        elif x.dtype.kind == 'f' and np.all(np.abs(x) < 2**63):
+            n = x.astype(np.int64)
+        else:
+            # Python ints of any size, int() rejects nan and inf
+            n = np.array([int(num) for num in x], dtype=object)
+
+        big_mark = self.big_mark
+        fmt = '{:,}'.format if big_mark else '{}'.format
+        numbers = [fmt(num) for num in n.tolist()]
+        if big_mark and big_mark != ',':
+            numbers = [s.replace(',', big_mark) for s in numbers]
+
+        prefix, suffix = self.prefix, self.suffix
+        labels = [''.join((prefix, s, o, suffix))
+                  for s, o in zip(numbers, _ordinal_suffixes(n))]
         return labels
 
 
@@ -777,21 +858,25 @@ class number_bytes_format:
         # possible exponents of base: eg 1000^1, 1000^2, 1000^3, ...
         exponents = np.arange(1, len(self._all_symbols)+1, dtype=float)
         self._powers = self.base ** exponents
+        # Divisors for each symbol, including base^0 for the bytes
+        self._powers_full = np.concatenate(([1.0], self._powers))
+        self._symbol_index = {s: i for i, s in enumerate(self._all_symbols)}
+        self._symbols_array = np.array(self._all_symbols)
         self._validate_symbol(symbol, ['auto'] + self._all_symbols)
 
     def __call__(self, x):
-        _all_symbols = self._all_symbols
         symbol = self.symbol
+        x = np.asarray(x)
         if symbol == 'auto':
-            power = [bisect_right(self._powers, val) for val in x]
-            symbols = [_all_symbols[p] for p in power]
+            # Binary search for the power of each value in a single
+            # pass over the array
+            power = np.searchsorted(self._powers, x, side='right')
+            symbols = self._symbols_array[power].tolist()
         else:
-            power = np.array(match([symbol], _all_symbols))
+            power = self._symbol_index[symbol]
             symbols = [symbol] * len(x)
 
-        x = np.asarray(x)
-        power = np.asarray(power, dtype=float)
-        values = x / self.base**power
+        values = x / self._powers_full[power]
         fmt = (self.fmt + '{}').format
         labels = [fmt(v, s) for v, s in zip(values, symbols)]
         return labels
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import pandas as pd
 import numpy as np
@@ -11,100 +11,79 @@ from mizani.breaks import (mpl_breaks, log_breaks, minor_breaks,
 from mizani.transforms import trans, log_trans
 
 
-def test_mpl_breaks():
+@pytest.fixture(scope='module')
+def limits100():
     x = np.arange(100)
-    limits = min(x), max(x)
-    for nbins in (5, 7, 10, 13, 31):
-        breaks = mpl_breaks(nbins=nbins)
-        assert len(breaks(limits)) <= nbins+1
+    # x is sorted, the limits are the endpoints
+    return x[0], x[-1]
+
+
+@pytest.mark.parametrize('nbins', [5, 7, 10, 13, 31])
+def test_mpl_breaks(limits100, nbins):
+    breaks = mpl_breaks(nbins=nbins)
+    assert len(breaks(limits100)) <= nbins+1
+
 
+def test_mpl_breaks_infinite_limits():
     limits = float('-inf'), float('inf')
     breaks = mpl_breaks(nbins=5)
     assert len(breaks(limits)) == 0
 
-    # Zero range discrete
-    limits = [1, 1]
-    assert len(breaks(limits)) == 1
-    assert breaks(limits)[0] == limits[1]
 
-    # Zero range continuous
-    limits = [np.pi, np.pi]
+@pytest.mark.parametrize('limits', [
+    [1, 1],           # Zero range discrete
+    [np.pi, np.pi],   # Zero range continuous
+])
+def test_mpl_breaks_zero_range(limits):
+    breaks = mpl_breaks(nbins=5)
     assert len(breaks(limits)) == 1
     assert breaks(limits)[0] == limits[1]
 
 
-def test_log_breaks():
-    x = [2, 20, 2000]
-    limits = min(x), max(x)
-    breaks = log_breaks()(limits)
-    npt.assert_array_equal(breaks, [1, 10, 100, 1000, 10000])
-
-    breaks = log_breaks(3)(limits)
-    npt.assert_array_equal(breaks, [1, 100, 10000])
-
-    breaks = log_breaks()((10000, 10000))
-    npt.assert_array_equal(breaks, [10000])
-
-    breaks = log_breaks()((float('-inf'), float('inf')))
-    assert len(breaks) == 0
-
-    # When the limits are in the same order of magnitude
-    breaks = log_breaks()([35, 60])
-    assert len(breaks) > 0
-    assert all([1 < b < 100 for b in breaks])
-
-    breaks = log_breaks()([200, 800])
-    npt.assert_array_equal(breaks, [100,  200,  300,  500, 1000])
-
-    breaks = log_breaks()((1664, 14008))
-    npt.assert_array_equal(breaks, [1000, 3000, 5000, 10000, 30000])
-
-    breaks = log_breaks()([407, 3430])
-    npt.assert_array_equal(breaks, [300,  500, 1000, 3000, 5000])
+@pytest.fixture(scope='module')
+def default_log_breaks():
+    return log_breaks()
 
-    breaks = log_breaks()([1761, 8557])
-    npt.assert_array_equal(breaks, [1000, 2000, 3000, 5000, 10000])
 
+LOG_BREAKS_CASES = [
+    # kwargs, limits, expected
+    (dict(), (2, 2000), [1, 10, 100, 1000, 10000]),
+    (dict(n=3), (2, 2000), [1, 100, 10000]),
+    (dict(), (10000, 10000), [10000]),
+    (dict(), (200, 800), [100, 200, 300, 500, 1000]),
+    (dict(), (1664, 14008), [1000, 3000, 5000, 10000, 30000]),
+    (dict(), (407, 3430), [300, 500, 1000, 3000, 5000]),
+    (dict(), (1761, 8557), [1000, 2000, 3000, 5000, 10000]),
     # log_breaks -> _log_sub_breaks -> extended_breaks
-    breaks = log_breaks(13)([1, 10])
-    npt.assert_array_almost_equal(
-        breaks,
-        np.arange(0, 11)
-    )
-
+    (dict(n=13), (1, 10), np.arange(0, 11)),
     # No overflow effects
-    breaks = log_breaks(n=6)([1e25, 1e30])
-    npt.assert_array_almost_equal(
-        breaks,
-        [1e25, 1e26, 1e27, 1e28, 1e29, 1e30]
-    )
-
+    (dict(n=6), (1e25, 1e30), [1e25, 1e26, 1e27, 1e28, 1e29, 1e30]),
     # No overflow effects in _log_sub_breaks
-    breaks = log_breaks()([2e19, 8e19])
-    npt.assert_array_almost_equal(
-        breaks,
-        [1.e+19, 2.e+19, 3.e+19, 5.e+19, 1.e+20]
-    )
-
+    (dict(), (2e19, 8e19), [1.e+19, 2.e+19, 3.e+19, 5.e+19, 1.e+20]),
     # _log_sub_breaks for base != 10
-    breaks = log_breaks(n=5, base=60)([2e5, 8e5])
-    npt.assert_array_almost_equal(
-        breaks,
-        [129600, 216000, 432000, 648000, 1080000]
-    )
+    (dict(n=5, base=60), (2e5, 8e5),
+     [129600, 216000, 432000, 648000, 1080000]),
+    (dict(n=5, base=2), (20, 80), [16, 32, 64, 128]),
+    # bases & negative breaks
+    (dict(base=2), (0.9, 2.9), [0.5, 1., 2., 4.]),
+]
 
-    breaks = log_breaks(n=5, base=2)([20, 80])
-    npt.assert_array_almost_equal(
-        breaks,
-        [16, 32, 64, 128]
-    )
 
-    # bases & negative breaks
-    breaks = log_breaks(base=2)([0.9, 2.9])
-    npt.assert_array_almost_equal(
-        breaks,
-        [0.5, 1., 2., 4.]
-    )
+@pytest.mark.parametrize('kwargs, limits, expected', LOG_BREAKS_CASES)
+def test_log_breaks(kwargs, limits, expected):
+    breaks = log_breaks(**kwargs)(limits)
+    npt.assert_array_almost_equal(breaks, expected)
+
+
+def test_log_breaks_infinite_limits(default_log_breaks):
+    breaks = default_log_breaks((float('-inf'), float('inf')))
+    assert len(breaks) == 0
+
+
+def test_log_breaks_same_order_of_magnitude(default_log_breaks):
+    breaks = default_log_breaks([35, 60])
+    assert len(breaks) > 0
+    assert all([1 < b < 100 for b in breaks])
 
 
 def test_minor_breaks():
@@ -135,41 +114,57 @@ def test_minor_breaks():
     assert len(minor) == 0
 
 
-def test_trans_minor_breaks():
-    class identity_trans(trans):
-        def __init__(self):
-            self.minor_breaks = trans_minor_breaks(identity_trans)
+class identity_trans(trans):
+    def __init__(self):
+        self.minor_breaks = trans_minor_breaks(identity_trans)
 
-    class square_trans(trans):
-        transform = staticmethod(np.square)
-        inverse = staticmethod(np.sqrt)
 
-        def __init__(self):
-            self.minor_breaks = trans_minor_breaks(square_trans)
+class square_trans(trans):
+    transform = staticmethod(np.square)
+    inverse = staticmethod(np.sqrt)
 
-    class weird_trans(trans):
-        dataspace_is_numerical = False
+    def __init__(self):
+        self.minor_breaks = trans_minor_breaks(square_trans)
 
-        def __init__(self):
-            self.minor_breaks = trans_minor_breaks(weird_trans)
 
-    major = [1, 2, 3, 4]
-    limits = [0, 5]
-    regular_minors = trans().minor_breaks(major, limits)
+class weird_trans(trans):
+    dataspace_is_numerical = False
+
+    def __init__(self):
+        self.minor_breaks = trans_minor_breaks(weird_trans)
+
+
+@pytest.fixture(scope='module')
+def identity():
+    return identity_trans()
+
+
+@pytest.fixture(scope='module')
+def square():
+    return square_trans()
+
+
+_MAJOR = np.array([1, 2, 3, 4])
+_LIMITS = np.array([0, 5])
+_MAJOR_SQ = _MAJOR**2
+_LIMITS_SQ = _LIMITS**2
+
+
+def test_trans_minor_breaks(identity, square):
+    regular_minors = trans().minor_breaks(_MAJOR, _LIMITS)
     npt.assert_allclose(
         regular_minors,
-        identity_trans().minor_breaks(major, limits))
+        identity.minor_breaks(_MAJOR, _LIMITS))
 
     # Transform the input major breaks and check against
     # the inverse of the output minor breaks
-    squared_input_minors = square_trans().minor_breaks(
-        np.square(major), np.square(limits))
-    npt.assert_allclose(regular_minors,
-                        np.sqrt(squared_input_minors))
+    npt.assert_allclose(
+        regular_minors,
+        np.sqrt(square.minor_breaks(_MAJOR_SQ, _LIMITS_SQ)))
 
     t = weird_trans()
     with pytest.raises(TypeError):
-        t.minor_breaks(major)
+        t.minor_breaks(_MAJOR)
 
     # Test minor_breaks for log scales are 2 less than the base
     base = 10
@@ -195,24 +190,38 @@ def test_trans_minor_breaks():
     )
 
 
+def _years(x):
+    """
+    Years of the dates in x
+    """
+    # The breaks are timezone aware, which numpy does
+    # not parse, so pandas does the conversion
+    return pd.DatetimeIndex(x).year.to_numpy()
+
+
+def _microseconds(x):
+    """
+    Durations in x as integer microseconds
+    """
+    return np.asarray(x, dtype='timedelta64[us]').astype(np.int64)
+
+
 def test_date_breaks():
     # cpython
-    x = [datetime(year, 1, 1) for year in [2010, 2026, 2015]]
+    x = pd.to_datetime([2010, 2026, 2015], format='%Y').to_pydatetime()
     limits = min(x), max(x)
 
     breaks = date_breaks('5 Years')
-    years = [d.year for d in breaks(limits)]
     npt.assert_array_equal(
-        years, [2010, 2015, 2020, 2025, 2030])
+        _years(breaks(limits)), [2010, 2015, 2020, 2025, 2030])
 
     breaks = date_breaks('10 Years')
-    years = [d.year for d in breaks(limits)]
-    npt.assert_array_equal(years, [2010, 2020, 2030])
+    npt.assert_array_equal(_years(breaks(limits)), [2010, 2020, 2030])
 
     # numpy
-    x = [np.datetime64(i*10, 'D') for i in range(1, 10)]
+    x = np.arange(10, 100, 10).astype('datetime64[D]')
     breaks = date_breaks('10 Years')
-    limits = min(x), max(x)
+    limits = x[0], x[-1]
     with pytest.raises(AttributeError):
         breaks(limits)
 
@@ -226,31 +235,30 @@ def test_timedelta_breaks():
     breaks = timedelta_breaks()
 
     # cpython
-    x = [timedelta(days=i*365) for i in range(25)]
-    limits = min(x), max(x)
+    x = pd.timedelta_range(0, periods=25, freq='365D').to_pytimedelta()
+    limits = x[0], x[-1]
     major = breaks(limits)
-    years = [val.total_seconds()/(365*24*60*60)for val in major]
+    years = _microseconds(major) / (365*24*60*60*10**6)
     npt.assert_array_equal(
         years, [0, 5, 10, 15, 20, 25])
 
-    x = [timedelta(microseconds=i) for i in range(25)]
-    limits = min(x), max(x)
+    x = pd.timedelta_range(0, periods=25, freq='us').to_pytimedelta()
+    limits = x[0], x[-1]
     major = breaks(limits)
-    mseconds = [val.total_seconds()*10**6 for val in major]
     npt.assert_array_equal(
-        mseconds, [0, 5, 10, 15, 20, 25])
+        _microseconds(major), [0, 5, 10, 15, 20, 25])
 
     # pandas
-    x = [pd.Timedelta(seconds=i*60) for i in range(10)]
-    limits = min(x), max(x)
+    x = pd.timedelta_range(0, periods=10, freq='60s')
+    limits = x[0], x[-1]
     major = breaks(limits)
-    minutes = [val.total_seconds()/60 for val in major]
+    minutes = _microseconds(major) / (60*10**6)
     npt.assert_allclose(
         minutes, [0, 2, 4, 6, 8])
 
     # numpy
-    x = [np.timedelta64(i*10, 'D') for i in range(1, 10)]
-    limits = min(x), max(x)
+    x = np.arange(10, 100, 10).astype('timedelta64[D]')
+    limits = x[0], x[-1]
     with pytest.raises(ValueError):
         breaks(limits)
 
@@ -259,13 +267,13 @@ def test_timedelta_breaks():
     assert len(breaks(limits)) == 0
 
 
-def test_extended_breaks():
-    x = np.arange(100)
-    limits = min(x), max(x)
-    for n in (5, 7, 10, 13, 31):
-        breaks = extended_breaks(n=n)
-        assert len(breaks(limits)) <= n+1
+@pytest.mark.parametrize('n', [5, 7, 10, 13, 31])
+def test_extended_breaks(limits100, n):
+    breaks = extended_breaks(n=n)
+    assert len(breaks(limits100)) <= n+1
 
+
+def test_extended_breaks_limits():
     # Reverse limits
     breaks = extended_breaks(n=7)
     npt.assert_array_equal(breaks((0, 6)), breaks((6, 0)))
@@ -275,12 +283,12 @@ def test_extended_breaks():
     breaks = extended_breaks(n=5)
     assert len(breaks(limits)) == 0
 
-    # Zero range discrete
-    limits = [1, 1]
-    assert len(breaks(limits)) == 1
-    assert breaks(limits)[0] == limits[1]
 
-    # Zero range continuous
-    limits = [np.pi, np.pi]
+@pytest.mark.parametrize('limits', [
+    [1, 1],           # Zero range discrete
+    [np.pi, np.pi],   # Zero range continuous
+])
+def test_extended_breaks_zero_range(limits):
+    breaks = extended_breaks(n=5)
     assert len(breaks(limits)) == 1
     assert breaks(limits)[0] == limits[1]
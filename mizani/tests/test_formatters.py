@@ -23,9 +23,8 @@ def test_custom_format():
     formatter = custom_format('%.2f USD', style='old')
     assert formatter(x) == labels
 
-    formatter = custom_format('%.2f USD', style='ancient')
     with pytest.raises(ValueError):
-        formatter(x)
+        custom_format('%.2f USD', style='ancient')
 
 
 def test_currency_format():
@@ -42,6 +41,21 @@ def test_currency_format():
     result = formatter(x)
     assert result == ['$1.23', '$99.23', '$4.60', '$9.00', '$4500.00']
 
+    # Thousands separator only affects the whole part
+    formatter = currency_format('', digits=4, big_mark=',')
+    result = formatter([-1234567.12345, 0.12345])
+    assert result == ['-1,234,567.1235', '0.1235']
+
+    # Any iterable
+    result = currency_format()(val for val in [1.232, 4500])
+    assert result == ['$1.23', '$4500.00']
+
+    # Changed parameters are used
+    formatter = currency_format()
+    formatter([1])
+    formatter.prefix, formatter.digits, formatter.big_mark = '€', 0, '.'
+    assert formatter([4500]) == ['€4.500']
+
 
 def test_comma_format():
     x = [1000, 2, 33000, 400]
@@ -62,6 +76,10 @@ def test_percent_format():
     assert formatter([.12, .23, .34, 45]) == \
         ['10%', '20%', '30%', '4500%']
 
+    formatter.big_mark = ','
+    assert formatter([.12, .23, .34, 45]) == \
+        ['10%', '20%', '30%', '4,500%']
+
 
 def test_scientific():
     formatter = scientific_format(2)
@@ -93,6 +111,7 @@ def test_log_format():
     assert formatter([3.000000000000001e-05]) == ['3e-5']
     assert formatter([1, 1e4]) == ['1', '1e4']
     assert formatter([1, 35, 60, 1e6]) == ['1', '4e1', '6e1', '1e6']
+    assert formatter([1.5e6, 2.5e-7]) == ['1.5e6', '2.5e-7']
 
     formatter = log_format(base=2)
     assert formatter([1, 10, 11, 1011]) == ['1', '10', '11', '1011']
@@ -108,6 +127,16 @@ def test_date_format():
     assert result == \
         ['2006:01:01', '2007:02:02', '2008:03:03', '2009:04:04']
 
+    # Naive dates are in UTC
+    x = [datetime(2010, 1, 1), datetime(2010, 1, 1, 3)]
+    result = date_format('%Y %H:%M %Z')(x)
+    assert result == ['2010 00:00 UTC', '2010 03:00 UTC']
+
+    # NaT is not a date
+    x = [pd.NaT, pd.Timestamp('2010-01-01')]
+    with pytest.raises(ValueError):
+        date_format()(x)
+
     # Different timezones
     pct = pytz.timezone('US/Pacific')
     ug = pytz.timezone('Africa/Kampala')
@@ -169,6 +198,16 @@ def test_ordinal_format():
     labels = ordinal_format(big_mark='.')(range(1200, 1205))
     assert labels == ['1.200th', '1.201st', '1.202nd', '1.203rd', '1.204th']
 
+    with pytest.raises(ValueError):
+        ordinal_format()([1, np.nan])
+
+    # Any iterable and arbitrarily large integers
+    labels = ordinal_format()(i for i in range(1, 4))
+    assert labels == ['1st', '2nd', '3rd']
+
+    labels = ordinal_format()([2**70])
+    assert labels == ['1180591620717411303424th']
+
 
 def test_number_bytes_format():
     x = [1000, 1000000, 4e5]